@@ -0,0 +1,5 @@
+"""
+Numeric helpers used by the response models
+
+Requires numpy, and uses numba to compile the kernels when it is installed
+"""
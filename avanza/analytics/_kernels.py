@@ -0,0 +1,53 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# Plain loops, compiled with numba when it is installed
+
+
+def _sum_by_month_year_loop(months, years, amounts, month, year):
+    total = 0.0
+    for i in range(len(amounts)):
+        if months[i] == month and years[i] == year:
+            total += amounts[i]
+    return total
+
+
+def _aggregate_loop(amounts, dates, types, from_d, to_d, n_types):
+    sums = np.zeros(n_types)
+    for i in range(len(amounts)):
+        if from_d <= dates[i] <= to_d:
+            sums[types[i]] += amounts[i]
+    return sums
+
+
+# Vectorized numpy versions, used when numba is not installed
+
+
+def _sum_by_month_year_numpy(months, years, amounts, month, year):
+    return float(amounts[(months == month) & (years == year)].sum())
+
+
+def _aggregate_numpy(amounts, dates, types, from_d, to_d, n_types):
+    in_range = (dates >= from_d) & (dates <= to_d)
+    return np.bincount(
+        types[in_range], weights=amounts[in_range], minlength=n_types
+    ).astype(np.float64)
+
+
+if njit is not None:
+    sum_by_month_year = njit(cache=True, fastmath=True)(_sum_by_month_year_loop)
+    aggregate = njit(cache=True, fastmath=True)(_aggregate_loop)
+else:
+    sum_by_month_year = _sum_by_month_year_numpy
+    aggregate = _aggregate_numpy
+
+
+def months_and_years(dates: np.ndarray):
+    """Splits a datetime64 array into (month 1-12, year) integer arrays"""
+    months = dates.astype("datetime64[M]").astype(np.int64)
+    return months % 12 + 1, months // 12 + 1970
@@ -3,6 +3,15 @@ from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 import requests
 
+# Use the fastest available JSON parser, all of them accept the raw bytes
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from msgspec.json import decode as json_loads
+    except ImportError:
+        from json import loads as json_loads
+
 from avanza.entities import StopLossOrderEvent, StopLossTrigger
 from avanza.models import *
 
@@ -119,7 +128,7 @@ class Avanza:
         return response_body, credentials
 
     def __call(
-        self, method: HttpMethod, path: str, options=None, return_content: bool = False
+        self, method: int, path: str, options=None, return_content: bool = False
     ):
         method_call = {
             HttpMethod.GET: self._session.get,
@@ -156,7 +165,16 @@ class Avanza:
         if return_content:
             return response.content
 
-        return response.json()
+        try:
+            return json_loads(response.content)
+        except ValueError as e:
+            # Raise the same error as response.json() would,
+            # so callers catching RequestException still catch it
+            raise requests.exceptions.JSONDecodeError(
+                getattr(e, "msg", str(e)),
+                getattr(e, "doc", response.text),
+                getattr(e, "pos", 0),
+            ) from e
 
     async def subscribe_to_id(
         self, channel: ChannelType, id: str, callback: Callable[[str, dict], Any]
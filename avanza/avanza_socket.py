@@ -10,6 +10,14 @@ WEBSOCKET_URL = "wss://www.avanza.se/_push/cometd"
 
 logger = logging.getLogger("avanza_socket")
 
+VALID_CHANNELS_FOR_MULTIPLE_IDS = frozenset(
+    (
+        ChannelType.ORDERS,
+        ChannelType.DEALS,
+        ChannelType.POSITIONS,
+    )
+)
+
 
 class AvanzaSocket:
     def __init__(self, push_subscription_id, cookies):
@@ -195,15 +203,9 @@ class AvanzaSocket:
         ids: Sequence[str],
         callback: Callable[[str, dict], Any],
     ):
-        valid_channels_for_multiple_ids = [
-            ChannelType.ORDERS,
-            ChannelType.DEALS,
-            ChannelType.POSITIONS,
-        ]
-
-        if len(ids) > 1 and channel not in valid_channels_for_multiple_ids:
+        if len(ids) > 1 and channel not in VALID_CHANNELS_FOR_MULTIPLE_IDS:
             raise ValueError(
-                f"Multiple ids is not supported for channels other than {valid_channels_for_multiple_ids}"
+                f"Multiple ids is not supported for channels other than {sorted(c.value for c in VALID_CHANNELS_FOR_MULTIPLE_IDS)}"
             )
 
         subscription_string = f'/{channel.value}/{",".join(ids)}'
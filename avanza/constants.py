@@ -114,7 +114,8 @@ class StopLossPriceType(enum.Enum):
     PERCENTAGE = "PERCENTAGE"
 
 
-class HttpMethod(enum.Enum):
+class HttpMethod:
+    # Plain integer constants, only ever compared for equality
     POST = 1
     GET = 2
     PUT = 3
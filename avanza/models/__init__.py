@@ -11,13 +11,14 @@ from .fund_info import FundInfo
 from .index_info import IndexInfo
 from .insights_report import InsightsReport
 from .inspiration_list import InspirationList
-from .list_inspiration_lists import InspirationListItem
-from .offer import Offer
-from .order_book import OrderBook
-from .overview import Overview
-from .price_alert import PriceAlert
+from .list_inspiration_lists import InspirationListItem, InspirationListItems
+from .offer import Offer, Offers
+from .order_book import OrderBook, OrderBooks
+from .overview import Accounts, Overview
+from .price_alert import PriceAlert, PriceAlerts
 from .search_result import SearchResults
 from .stock_info import StockInfo
-from .transaction import Transactions
+from .transaction import TransactionList, Transactions
 from .warrant_info import WarrantInfo
-from .watch_list import WatchList
+from .watch_list import WatchList, WatchLists
+from ._construct import construct
@@ -0,0 +1,34 @@
+from typing import Literal, get_args
+from pydantic import BaseModel
+
+from .search_result import SearchInstrumentType
+
+InstrumentTypeName = Literal[
+    "STOCK",
+    "FUND",
+    "BOND",
+    "OPTION",
+    "FUTURE_FORWARD",
+    "CERTIFICATE",
+    "WARRANT",
+    "EXCHANGE_TRADED_FUND",
+    "INDEX",
+    "PREMIUM_BOND",
+    "SUBSCRIPTION_OPTION",
+    "EQUITY_LINKED_BOND",
+    "CONVERTIBLE",
+]
+""" Instrument type as returned by the API, uppercase unlike InstrumentType """
+
+# Written out so type checkers can see the values, kept in sync with SearchInstrumentType
+if set(get_args(InstrumentTypeName)) != {t.value for t in SearchInstrumentType}:
+    raise RuntimeError("InstrumentTypeName and SearchInstrumentType values differ")
+
+
+class Money(BaseModel):
+    """Numeric value with unit, shared by balances, performances and amounts"""
+
+    value: float
+    unit: str
+    unitType: str
+    decimalPrecision: int
@@ -0,0 +1,117 @@
+import functools
+import types
+from datetime import date, datetime
+from typing import Annotated, Any, Callable, Tuple, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from ._date import parse_date, parse_datetime
+
+
+def construct(type_: Any, data: Any) -> Any:
+    """
+    Builds type_ from already trusted data, such as a response from Avanza,
+    without running any validation
+
+    Nested models, lists and dicts are built recursively
+    and ISO date strings are parsed for date fields.
+    Field validators with mode="before" are applied and called with only the
+    value, other validators are not run.
+    For unions of models the first model which has all its required fields
+    present in data is used.
+
+    Use model_validate when data might not match the model.
+    """
+    if data is None:
+        return None
+
+    origin = get_origin(type_)
+
+    if origin is Annotated:
+        return construct(get_args(type_)[0], data)
+
+    if origin is Union or origin is types.UnionType:
+        return _construct_union(get_args(type_), data)
+
+    if origin is list:
+        (item_type,) = get_args(type_) or (Any,)
+        return [construct(item_type, item) for item in data]
+
+    if origin is dict:
+        _, value_type = get_args(type_) or (Any, Any)
+        return {key: construct(value_type, value) for key, value in data.items()}
+
+    if isinstance(data, str) and isinstance(type_, type):
+        # Dates are kept as str by the API, parse them as validation would
+        if issubclass(type_, datetime):
+            return parse_datetime(data)
+        if issubclass(type_, date):
+            return parse_date(data)
+
+    if not isinstance(type_, type) or not isinstance(data, dict):
+        return data
+
+    if issubclass(type_, BaseModel):
+        return type_.model_construct(
+            **{
+                key: construct(annotation, _apply(before_validators, data[key]))
+                for key, annotation, _, before_validators in _model_fields(type_)
+                if key in data
+            }
+        )
+
+    return data
+
+
+def _construct_union(candidates: Tuple[Any, ...], data: Any) -> Any:
+    candidates = [c for c in candidates if c is not type(None)]
+
+    if len(candidates) == 1:
+        return construct(candidates[0], data)
+
+    if isinstance(data, dict):
+        for candidate in candidates:
+            model = candidate
+            if get_origin(model) is Annotated:
+                model = get_args(model)[0]
+
+            if isinstance(model, type) and issubclass(model, BaseModel):
+                if all(
+                    key in data
+                    for key, _, required, _ in _model_fields(model)
+                    if required
+                ):
+                    return construct(model, data)
+
+    return data
+
+
+def _apply(validators: Tuple[Callable[[Any], Any], ...], value: Any) -> Any:
+    for validator in validators:
+        value = validator(value)
+    return value
+
+
+@functools.cache
+def _model_fields(
+    model: type,
+) -> Tuple[Tuple[str, Any, bool, Tuple[Callable[[Any], Any], ...]], ...]:
+    """(key in response, annotation, is required, before validators) for each field of model"""
+    before_validators = {}
+    for decorator in model.__pydantic_decorators__.field_validators.values():
+        if decorator.info.mode == "before":
+            for name in decorator.info.fields:
+                # Pydantic runs the last defined before validator first
+                before_validators[name] = (decorator.func,) + before_validators.get(
+                    name, ()
+                )
+
+    return tuple(
+        (
+            field.alias or name,
+            field.annotation,
+            field.is_required(),
+            before_validators.get(name, ()),
+        )
+        for name, field in model.model_fields.items()
+    )
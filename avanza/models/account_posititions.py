@@ -1,12 +1,11 @@
 from typing import Optional, List
 from pydantic import BaseModel
 
+from ._common import InstrumentTypeName, Money
 
-class QuoteInfo(BaseModel):
-    value: float
-    unit: str
-    unitType: str
-    decimalPrecision: int
+QuoteInfo = Money
+Volume = Money
+Value = Money
 
 
 class LastDeal(BaseModel):
@@ -32,15 +31,16 @@ class Orderbook(BaseModel):
     flagCode: Optional[str]
     """ ISO 3166-1 alpha-2 """
     name: str
-    type: str
+    type: InstrumentTypeName
     tradeStatus: str
+    """ Example: BUYABLE_AND_SELLABLE """
     quote: Quote
     turnover: Turnover
     lastDeal: Optional[LastDeal]
 
 
 class Instrument(BaseModel):
-    type: str
+    type: InstrumentTypeName
     name: str
     orderbook: Optional[Orderbook]
     currency: str
@@ -57,45 +57,27 @@ class Account(BaseModel):
     hasCredit: bool
 
 
-class Volume(BaseModel):
-    value: float
-    unit: str
-    unitType: str
-    decimalPrecision: int
-
-
-class Value(BaseModel):
-    value: float
-    unit: str
-    unitType: str
-    decimalPrecision: int
-
-
 class Performance(BaseModel):
     absolute: QuoteInfo
     relative: QuoteInfo
 
 
-class WithOrderbook(BaseModel):
+class _PositionBase(BaseModel):
     account: Account
     instrument: Instrument
     volume: Volume
     value: Value
     averageAcquiredPrice: Value
     acquiredValue: Value
-    lastTradingDayPerformance: Performance
     id: str
 
 
-class WithoutOrderbook(BaseModel):
-    account: Account
-    instrument: Instrument
-    volume: Volume
-    value: Value
-    averageAcquiredPrice: Value
-    acquiredValue: Value
+class WithOrderbook(_PositionBase):
+    lastTradingDayPerformance: Performance
+
+
+class WithoutOrderbook(_PositionBase):
     lastTradingDayPerformance: Optional[Performance]
-    id: str
 
 
 class CashPosition(BaseModel):
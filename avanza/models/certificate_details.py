@@ -1,5 +1,5 @@
-from typing import Any, List
-from pydantic import BaseModel
+from typing import List
+from pydantic import BaseModel, ConfigDict, SkipValidation
 from .underlying import Underlying
 
 
@@ -14,12 +14,16 @@ class Fee(BaseModel):
 
 
 class Order(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     price: float
     priceString: str
     volume: int
 
 
 class OrderDepthLevels(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     buySide: Order
     sellSide: Order
 
@@ -34,7 +38,7 @@ class CertificateDetails(BaseModel):
     leverage: float
     documents: Documents
     fee: Fee
-    trades: List[dict]
+    trades: SkipValidation[list]
     orderDepthLevels: List[OrderDepthLevels]
-    brokerTradeSummaries: List[Any]
+    brokerTradeSummaries: SkipValidation[list]
     collateralValue: float
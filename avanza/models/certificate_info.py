@@ -1,3 +1,4 @@
+from typing import Literal
 from pydantic import BaseModel
 
 from .historical_closing_prices import HistoricalClosingPrices
@@ -34,5 +35,4 @@ class CertificateInfo(BaseModel):
     historicalClosingPrices: HistoricalClosingPrices
     keyIndicators: KeyIndicators
     quote: Quote
-    type: str
-    """ CERTIFICATE """
+    type: Literal["CERTIFICATE"]
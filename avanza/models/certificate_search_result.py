@@ -1,6 +1,8 @@
 from typing import List
 from pydantic import BaseModel
 
+from ._common import InstrumentTypeName
+
 
 class CertificateTopHit(BaseModel):
     currency: str
@@ -16,7 +18,7 @@ class CertificateTopHit(BaseModel):
 
 
 class CertificateHit(BaseModel):
-    instrumentType: str
+    instrumentType: InstrumentTypeName
     numberOfHits: int
     topHits: List[CertificateTopHit]
 
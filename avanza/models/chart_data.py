@@ -1,8 +1,16 @@
+from bisect import bisect_left
 from typing import List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class Ohlc(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     timestamp: int
     """ Unix timestamp (millisecond) """
     open: float
@@ -21,9 +29,37 @@ class Metadata(BaseModel):
     resolution: Resolution
 
 
+def _timestamp(ohlc: Ohlc) -> int:
+    return ohlc.timestamp
+
+
 class ChartData(BaseModel):
     ohlc: List[Ohlc]
     metadata: Metadata
     from_: str = Field(..., alias="from")
     to: str
     previousClosingPrice: float
+
+    @property
+    def timestamps(self) -> "np.ndarray":
+        """The ohlc timestamps as an int64 array
+
+        Built from ohlc on every access, so it never goes stale when ohlc changes
+
+        Requires numpy, install it with `pip install avanza-api[numpy]`
+        """
+        if np is None:
+            raise ImportError(
+                "ChartData.timestamps requires numpy, install it with pip install avanza-api[numpy]"
+            )
+
+        return np.fromiter(
+            (o.timestamp for o in self.ohlc), dtype=np.int64, count=len(self.ohlc)
+        )
+
+    def ohlc_since(self, timestamp: int) -> List[Ohlc]:
+        """Returns the ohlc entries at or after timestamp (unix milliseconds)
+
+        ohlc is ordered by timestamp, so the first entry is found with a binary search
+        """
+        return self.ohlc[bisect_left(self.ohlc, timestamp, key=_timestamp) :]
@@ -1,5 +1,5 @@
-from typing import Any, List
-from pydantic import BaseModel
+from typing import List
+from pydantic import BaseModel, SkipValidation
 
 
 class Account(BaseModel):
@@ -9,7 +9,7 @@ class Account(BaseModel):
 
 
 class DealsAndOrders(BaseModel):
-    orders: List[Any]
-    deals: List[Any]
+    orders: SkipValidation[list]
+    deals: SkipValidation[list]
     accounts: List[Account]
     reservedAmount: float
@@ -1,3 +1,4 @@
+from datetime import date, datetime
 from typing import List, Optional
 from pydantic import BaseModel
 
@@ -16,7 +17,7 @@ class ChartData(BaseModel):
 
 class FundManager(BaseModel):
     name: str
-    startDate: str
+    startDate: date
     """ YYYY-MM-DD """
 
 
@@ -33,7 +34,7 @@ class ProductInvolvement(BaseModel):
 
 
 class FundRatingView(BaseModel):
-    date: str
+    date: datetime
     """ Example: 2011-11-11T11:11:11 """
     fundRatingType: str
     """ Example: "THREE_YEARS" """
@@ -45,7 +46,7 @@ class FundInfo(BaseModel):
     name: str
     description: str
     nav: float
-    navDate: str
+    navDate: datetime
     """ Example: 2011-11-11T11:11:11 """
     currency: str
     """ ISO 4217 """
@@ -70,7 +71,7 @@ class FundInfo(BaseModel):
     sharpeRatio: float
     standardDeviation: float
     capital: float
-    startDate: str
+    startDate: date
     """ YYYY-MM-DD """
     fundManagers: List[FundManager]
     adminCompany: AdminCompany
@@ -87,7 +88,7 @@ class FundInfo(BaseModel):
     hedgeFund: bool
     ucitsFund: bool
     recommendedHoldingPeriod: str
-    portfolioDate: str
+    portfolioDate: date
     """ YYYY-MM-DD """
     ppmCode: str
     superloanOrderbook: bool
@@ -1,6 +1,8 @@
 from typing import List
 from pydantic import BaseModel
 
+from ._common import InstrumentTypeName
+
 
 class FundTopHit(BaseModel):
     changeSinceOneDay: float
@@ -17,7 +19,7 @@ class FundTopHit(BaseModel):
 
 
 class FundHit(BaseModel):
-    instrumentType: str
+    instrumentType: InstrumentTypeName
     numberOfHits: int
     topHits: List[FundTopHit]
 
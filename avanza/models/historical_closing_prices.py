@@ -1,3 +1,4 @@
+from datetime import date
 from typing import Optional
 from pydantic import BaseModel
 
@@ -13,5 +14,5 @@ class HistoricalClosingPrices(BaseModel):
     fiveYears: Optional[float] = None
     tenYears: Optional[float] = None
     start: float
-    startDate: str
+    startDate: date
     """ YYYY-MM-DD """
@@ -1,33 +1,7 @@
-from typing import Any, List
-from pydantic import BaseModel
+from pydantic import BaseModel, SkipValidation
 
-
-class Listing(BaseModel):
-    shortName: str
-    tickerSymbol: str
-    countryCode: str
-    """ ISO 3166-1 alpha-2 """
-    currency: str
-    """ ISO 4217 """
-    marketPlaceCode: str
-    marketPlaceName: str
-    tickSizeListId: str
-    marketTradesAvailable: bool
-
-
-class HistoricalClosingPrices(BaseModel):
-    oneDay: float
-    oneWeek: float
-    oneMonth: float
-    threeMonths: float
-    startOfYear: float
-    oneYear: float
-    threeYears: float
-    fiveYears: float
-    tenYears: float
-    start: float
-    startDate: str
-    """ YYYY-MM-DD """
+from .historical_closing_prices import HistoricalClosingPrices
+from .listing import Listing
 
 
 class KeyIndicators(BaseModel):
@@ -54,7 +28,7 @@ class IndexInfo(BaseModel):
     name: str
     isin: str
     instrumentId: str
-    sectors: List[Any]
+    sectors: SkipValidation[list]
     tradable: str
     listing: Listing
     historicalClosingPrices: HistoricalClosingPrices
@@ -1,5 +1,16 @@
-from typing import Any, List, Literal, Union
-from pydantic import BaseModel
+from datetime import date
+from typing import Any, List, Optional
+from pydantic import BaseModel, SkipValidation, field_validator
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _none_if_dash(value: Any) -> Any:
+    """The API returns "-" instead of null when a percentage can't be calculated"""
+    return None if value == "-" else value
 
 
 class TotalOutcome(BaseModel):
@@ -24,19 +35,26 @@ class Link(BaseModel):
 class PositionListItemOutcome(BaseModel):
     total: float
     development: float
-    balanceDevelopments: List[Any]
-    totalDevelopmentInPercent: Union[float, Literal["-"]]
+    balanceDevelopments: SkipValidation[list]
+    totalDevelopmentInPercent: Optional[float]
     stake: float
     totalTurnover: float
-    transactions: List[Any]
-    transactionTotals: List[Any]
+    transactions: SkipValidation[list]
+    transactionTotals: SkipValidation[list]
     totalBuyAmount: float
     totalSellAmount: float
     totalOtherAmount: float
-    developmentPartOfTotalDevelopmentInPercent: Union[float, Literal["-"]]
-    dividendsPartOfTotalDevelopmentInPercent: Union[float, Literal["-"]]
+    developmentPartOfTotalDevelopmentInPercent: Optional[float]
+    dividendsPartOfTotalDevelopmentInPercent: Optional[float]
     dividends: float
 
+    _dash_to_none = field_validator(
+        "totalDevelopmentInPercent",
+        "developmentPartOfTotalDevelopmentInPercent",
+        "dividendsPartOfTotalDevelopmentInPercent",
+        mode="before",
+    )(_none_if_dash)
+
 
 class PositionSummaryListItem(BaseModel):
     isin: str
@@ -51,7 +69,7 @@ class PositionSummaryListItem(BaseModel):
 class PositionSummaryOutcome(BaseModel):
     total: float
     development: float
-    balanceDevelopments: List[Any]
+    balanceDevelopments: SkipValidation[list]
     dividends: float
 
 
@@ -68,7 +86,7 @@ class BestAndWorst(BaseModel):
 
 class DevelopmentResponse(BaseModel):
     totalOutcome: TotalOutcome
-    unknownPositionDevelopments: List[Any]
+    unknownPositionDevelopments: SkipValidation[list]
     totalOutcomeForUnknownDevelopments: TotalOutcome
     hasUnlistedInstrument: bool
     bestAndWorst: BestAndWorst
@@ -85,12 +103,35 @@ class ChartData(BaseModel):
 
 class TransactionsResponse(BaseModel):
     chartData: List[ChartData]
-    allTransactions: List[Any]
+    allTransactions: SkipValidation[list]
     totalAutogiro: float
     totalAll: float
     totalDeposits: float
     totalWithdraws: float
 
+    def deposits(self, month: int, year: int) -> float:
+        """Sum of deposits during month (1-12) of year
+
+        Requires numpy, install it with `pip install avanza-api[numpy]`
+        """
+        if np is None:
+            raise ImportError(
+                "TransactionsResponse.deposits requires numpy, install it with pip install avanza-api[numpy]"
+            )
+
+        from ..analytics._kernels import sum_by_month_year
+
+        chart_data = self.chartData
+        count = len(chart_data)
+
+        return sum_by_month_year(
+            np.fromiter((c.month for c in chart_data), dtype=np.int64, count=count),
+            np.fromiter((c.year for c in chart_data), dtype=np.int64, count=count),
+            np.fromiter((c.deposit for c in chart_data), dtype=np.float64, count=count),
+            month,
+            year,
+        )
+
 
 class TotalDevelopment(BaseModel):
     startValue: float
@@ -99,7 +140,7 @@ class TotalDevelopment(BaseModel):
 
 
 class OtherTransactions(BaseModel):
-    otherTransactionsGroups: List[Any]
+    otherTransactionsGroups: SkipValidation[list]
     total: float
 
 
@@ -108,8 +149,12 @@ class InsightsReport(BaseModel):
     transactionsResponse: TransactionsResponse
     totalDevelopment: TotalDevelopment
     otherTransactions: OtherTransactions
-    fromDate: str
+    fromDate: date
     """ YYYY-MM-DD """
-    toDate: str
+    toDate: date
     """ YYYY-MM-DD """
-    aggregatedPerformance: Union[float, Literal["-"]]
+    aggregatedPerformance: Optional[float]
+
+    _dash_to_none = field_validator("aggregatedPerformance", mode="before")(
+        _none_if_dash
+    )
@@ -1,44 +1,15 @@
-from typing import List, Optional, Union
+from typing import List, Optional
 from pydantic import BaseModel
 
+from ._common import InstrumentTypeName
+from .order_book_base import InspirationOrderBook
+
 
 class HighlightField(BaseModel):
     label: str
     percent: bool
 
 
-class StockOrderBook(BaseModel):
-    """Used when InspirationListItem.instrumentType is STOCK"""
-
-    change: float
-    changePercent: float
-    updated: str
-    """ Example 2011-11-11T11:11:11.504+0200 """
-    priceOneYearAgo: Optional[float] = None
-    priceThreeMonthsAgo: Optional[float] = None
-    currency: str
-    """ ISO 4217 """
-    lastPrice: float
-    flagCode: str
-    """ ISO 3166-1 alpha-2 """
-    highlightValue: float
-    name: str
-    id: str
-
-
-class FundOrderBook(BaseModel):
-    """Used when InspirationListItem.instrumentType is FUND"""
-
-    lastUpdated: str
-    """ YYYY-MM-DD """
-    changeSinceOneDay: float
-    changeSinceThreeMonths: float
-    changeSinceOneYear: float
-    highlightValue: Optional[float] = None
-    name: str
-    id: str
-
-
 class Statistics(BaseModel):
     positiveCount: int
     neutralCount: int
@@ -49,7 +20,7 @@ class Statistics(BaseModel):
 
 
 class InspirationList(BaseModel):
-    orderbooks: List[Union[StockOrderBook, FundOrderBook]]
+    orderbooks: List[InspirationOrderBook]
     imageUrl: str
     """ relative URL """
     information: str
@@ -59,4 +30,4 @@ class InspirationList(BaseModel):
     name: str
     id: str
     statistics: Statistics
-    instrumentType: str
+    instrumentType: InstrumentTypeName
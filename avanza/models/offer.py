@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from typing import List
+from pydantic import BaseModel, TypeAdapter
 
 
 class Offer(BaseModel):
@@ -7,3 +8,6 @@ class Offer(BaseModel):
     lastResponseDate: str
     type: str
     hasResponded: bool
+
+
+Offers = TypeAdapter(List[Offer])
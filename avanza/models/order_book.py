@@ -1,4 +1,7 @@
-from pydantic import BaseModel
+from typing import List
+from pydantic import BaseModel, TypeAdapter
+
+from ._common import InstrumentTypeName
 
 
 class OrderBook(BaseModel):
@@ -19,4 +22,7 @@ class OrderBook(BaseModel):
     sellable: bool
     buyable: bool
     tradable: bool
-    instrumentType: str
+    instrumentType: InstrumentTypeName
+
+
+OrderBooks = TypeAdapter(List[OrderBook])
@@ -0,0 +1,51 @@
+from datetime import date
+from typing import Annotated, Any, Optional, Union
+from pydantic import BaseModel, Discriminator, Tag
+
+
+class StockOrderBook(BaseModel):
+    """Used when InspirationListItem.instrumentType is STOCK"""
+
+    change: float
+    changePercent: float
+    updated: str
+    """ Example 2011-11-11T11:11:11.504+0200 """
+    priceOneYearAgo: Optional[float] = None
+    priceThreeMonthsAgo: Optional[float] = None
+    currency: str
+    """ ISO 4217 """
+    lastPrice: float
+    flagCode: str
+    """ ISO 3166-1 alpha-2 """
+    highlightValue: float
+    name: str
+    id: str
+
+
+class FundOrderBook(BaseModel):
+    """Used when InspirationListItem.instrumentType is FUND"""
+
+    lastUpdated: date
+    """ YYYY-MM-DD """
+    changeSinceOneDay: float
+    changeSinceThreeMonths: float
+    changeSinceOneYear: float
+    highlightValue: Optional[float] = None
+    name: str
+    id: str
+
+
+def _order_book_type(value: Any) -> str:
+    # Only fund order books have a lastUpdated field
+    if isinstance(value, dict):
+        return "FUND" if "lastUpdated" in value else "STOCK"
+    return "FUND" if isinstance(value, FundOrderBook) else "STOCK"
+
+
+InspirationOrderBook = Annotated[
+    Union[
+        Annotated[StockOrderBook, Tag("STOCK")],
+        Annotated[FundOrderBook, Tag("FUND")],
+    ],
+    Discriminator(_order_book_type),
+]
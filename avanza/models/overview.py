@@ -1,12 +1,10 @@
-from typing import Any, List, Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, SkipValidation, TypeAdapter
 
+from ._common import Money
 
-class PerformanceInfo(BaseModel):
-    value: float
-    unit: str
-    unitType: str
-    decimalPrecision: int
+PerformanceInfo = Money
+Balance = Money
 
 
 class Performance(BaseModel):
@@ -14,26 +12,38 @@ class Performance(BaseModel):
     relative: PerformanceInfo
 
 
+class PerformancePeriods(BaseModel):
+    """Performance per time period, keyed by TimePeriod values"""
+
+    # Any period not listed here fails validation instead of being dropped silently
+    model_config = ConfigDict(extra="forbid")
+
+    TODAY: Performance | None = None
+    ONE_WEEK: Performance | None = None
+    ONE_MONTH: Performance | None = None
+    THREE_MONTHS: Performance | None = None
+    THIS_YEAR: Performance | None = None
+    ONE_YEAR: Performance | None = None
+    THREE_YEARS: Performance | None = None
+    FIVE_YEARS: Performance | None = None
+    THREE_YEARS_ROLLING: Performance | None = None
+    FIVE_YEARS_ROLLING: Performance | None = None
+    ALL_TIME: Performance | None = None
+
+
 class SavingsGoalView(BaseModel):
     goalAmount: float
     percentCompleted: float
     sharedGoal: bool
 
 
-class Balance(BaseModel):
-    value: float
-    unit: str
-    unitType: str
-    decimalPrecision: int
-
-
 class Category(BaseModel):
     name: str
     totalValue: Balance
     buyingPower: Balance
     id: str
     profit: Performance
-    performance: dict[str, Performance]
+    performance: PerformancePeriods
     savingsGoalView: SavingsGoalView | None
     sortOrder: int
 
@@ -61,7 +71,7 @@ class Account(BaseModel):
     errorStatus: str
     overmortgaged: bool
     overdrawn: bool
-    performance: dict[str, Performance]
+    performance: PerformancePeriods
     settings: dict[str, bool]
     clearingNumber: Optional[str]
     accountNumber: Optional[str]
@@ -70,7 +80,7 @@ class Account(BaseModel):
 
 
 class AccountsSummary(BaseModel):
-    performance: dict[str, Performance]
+    performance: PerformancePeriods
     buyingPower: Balance
     totalValue: Balance
 
@@ -78,5 +88,8 @@ class AccountsSummary(BaseModel):
 class Overview(BaseModel):
     categories: List[Category]
     accounts: List[Account]
-    loans: List[Any]
+    loans: SkipValidation[list]
     accountsSummary: AccountsSummary
+
+
+Accounts = TypeAdapter(List[Account])
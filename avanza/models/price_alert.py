@@ -1,11 +1,13 @@
-from pydantic import BaseModel
+from datetime import date
+from typing import List
+from pydantic import BaseModel, TypeAdapter
 
 
 class PriceAlert(BaseModel):
     alertId: str
     accountId: str
     price: float
-    validUntil: str
+    validUntil: date
     """ YYYY-MM-DD """
     direction: str
     """ ABOVE/BELOW """
@@ -13,3 +15,6 @@ class PriceAlert(BaseModel):
     email: bool
     notification: bool
     sms: bool
+
+
+PriceAlerts = TypeAdapter(List[PriceAlert])
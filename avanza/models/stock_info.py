@@ -1,3 +1,4 @@
+from datetime import date
 from typing import List
 from pydantic import BaseModel
 
@@ -18,14 +19,14 @@ class ShareInfo(BaseModel):
 
 
 class ReportInfo(BaseModel):
-    date: str
+    date: date
     """ YYYY-MM-DD """
     reportType: str
 
 
 class KeyIndicators(BaseModel):
     numberOfOwners: int
-    reportDate: str
+    reportDate: date
     """" YYYY-MM-DD """
     volatility: float
     beta: float
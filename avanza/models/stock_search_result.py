@@ -1,8 +1,12 @@
 from typing import List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from ._common import InstrumentTypeName
 
 
 class TopHit(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     currency: str
     """ ISO 4217 """
     changePercent: float
@@ -16,7 +20,7 @@ class TopHit(BaseModel):
 
 
 class Hit(BaseModel):
-    instrumentType: str
+    instrumentType: InstrumentTypeName
     numberOfHits: int
     topHits: List[TopHit]
 
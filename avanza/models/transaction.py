@@ -1,5 +1,16 @@
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field, TypeAdapter
+
+from ._common import Money
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+Info = Money
+CurrencyRate = Money
 
 
 class Account(BaseModel):
@@ -22,38 +33,25 @@ class Orderbook(BaseModel):
     volumeFactor: float
 
 
-class Info(BaseModel):
-    value: float
-    unit: str
-    unitType: str
-    decimalPrecision: int
-
-
-class CurrencyRate(BaseModel):
-    value: float
-    unit: str
-    unitType: str
-    decimalPrecision: int
-
-
 class Transaction(BaseModel):
-    id: str
-    date: str
+    date: datetime
     """ Example 2011-11-11T11:11:11 """
-    settlementDate: str
+    tradeDate: date
     """ YYYY-MM-DD """
-    availabilityDate: str
+    type: str
+    amount: Info
+    isin: str
+    instrumentName: Optional[str]
+    id: str
+    settlementDate: date
     """ YYYY-MM-DD """
-    tradeDate: str
+    availabilityDate: date
     """ YYYY-MM-DD """
     account: Account
     orderbook: Optional[Orderbook]
-    instrumentName: Optional[str]
     description: str
-    type: str
     volume: Optional[Info]
     priceInTradedCurrency: Optional[Info]
-    amount: Info
     onCreditAccount: bool
     comission: Optional[Info]
     currencyRate: Optional[CurrencyRate]
@@ -61,15 +59,14 @@ class Transaction(BaseModel):
     priceInAccountCurrency: Optional[Info]
     intraday: bool
     foreignTaxRate: Optional[CurrencyRate]
-    isin: str
     result: Optional[Info]
     volumeFactor: Optional[float]
 
 
 class DateRange(BaseModel):
-    from_: str = Field(..., alias="from")
+    from_: date = Field(..., alias="from")
     """ YYYY-MM-DD """
-    to: str
+    to: date
     """ YYYY-MM-DD """
 
 
@@ -84,5 +81,78 @@ class Transactions(BaseModel):
     transactions: List[Transaction]
     transactionsAfterFiltering: int
     transactionsFilter: TransactionsFilter
-    firstTransactionDate: str
+    firstTransactionDate: date
     """ YYYY-MM-DD """
+
+    def to_columns(self) -> Dict[str, "np.ndarray"]:
+        """Returns the transactions as one numpy array per field
+
+        Requires numpy, install it with `pip install avanza-api[numpy]`
+
+        Returns:
+
+            {
+                "date": datetime64[D],
+                "amount": float64,
+                "volume": float64, NaN when the transaction has no volume
+                "type": object,
+                "isin": object,
+            }
+        """
+        if np is None:
+            raise ImportError(
+                "Transactions.to_columns requires numpy, install it with pip install avanza-api[numpy]"
+            )
+
+        transactions = self.transactions
+        count = len(transactions)
+
+        return {
+            "date": np.array([t.date for t in transactions], dtype="datetime64[D]"),
+            "amount": np.fromiter(
+                (t.amount.value for t in transactions), dtype=np.float64, count=count
+            ),
+            "volume": np.fromiter(
+                (np.nan if t.volume is None else t.volume.value for t in transactions),
+                dtype=np.float64,
+                count=count,
+            ),
+            "type": np.array([t.type for t in transactions], dtype=object),
+            "isin": np.array([t.isin for t in transactions], dtype=object),
+        }
+
+    def sum_amount(self, month: int, year: int) -> float:
+        """Sum of the amount of all transactions during month (1-12) of year
+
+        Requires numpy, install it with `pip install avanza-api[numpy]`
+        """
+        from ..analytics._kernels import months_and_years, sum_by_month_year
+
+        columns = self.to_columns()
+        months, years = months_and_years(columns["date"])
+
+        return sum_by_month_year(months, years, columns["amount"], month, year)
+
+    def sum_by_type(self, from_date: date, to_date: date) -> Dict[str, float]:
+        """Sum of the amount per transaction type between from_date and to_date, inclusive
+
+        Requires numpy, install it with `pip install avanza-api[numpy]`
+        """
+        from ..analytics._kernels import aggregate
+
+        columns = self.to_columns()
+        names, types = np.unique(columns["type"], return_inverse=True)
+
+        sums = aggregate(
+            columns["amount"],
+            columns["date"].astype(np.int64),
+            types.astype(np.int64),
+            np.datetime64(from_date, "D").astype(np.int64),
+            np.datetime64(to_date, "D").astype(np.int64),
+            len(names),
+        )
+
+        return dict(zip(names.tolist(), sums.tolist()))
+
+
+TransactionList = TypeAdapter(List[Transaction])
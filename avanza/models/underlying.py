@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from ._common import InstrumentTypeName
 from .quote import Quote
 from .listing import Listing
 
@@ -6,7 +7,7 @@ from .listing import Listing
 class Underlying(BaseModel):
     orderbookId: str
     name: str
-    instrumentType: str
+    instrumentType: InstrumentTypeName
     """ Example: STOCK """
     quote: Quote
     listing: Listing
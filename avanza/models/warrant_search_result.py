@@ -1,6 +1,8 @@
 from typing import List
 from pydantic import BaseModel
 
+from ._common import InstrumentTypeName
+
 
 class WarrantTopHit(BaseModel):
     currency: str
@@ -16,7 +18,7 @@ class WarrantTopHit(BaseModel):
 
 
 class WarrantHit(BaseModel):
-    instrumentType: str
+    instrumentType: InstrumentTypeName
     numberOfHits: int
     topHits: List[WarrantTopHit]
 
@@ -1,22 +1,26 @@
-from typing import List
-from pydantic import BaseModel
+from typing import List, Sequence
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
 
 
-class CustomerId(BaseModel):
+class CustomerId(TypedDict):
     id: int
 
 
-class UserId(BaseModel):
+class UserId(TypedDict):
     customerId: CustomerId
 
 
-class WatchList(BaseModel):
+class WatchList(TypedDict):
     watchListId: str
     userId: UserId
-    orderbookIds: List[str]
+    orderbookIds: Sequence[str]
     created: str
     """ ISO 8601 """
     modified: str
     """ ISO 8601 """
     name: str
     urlName: str
+
+
+WatchLists = TypeAdapter(List[WatchList])
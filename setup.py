@@ -22,7 +22,12 @@ VERSION = "14.0.0"
 
 REQUIRED = ["requests>=2", "pyotp>=2", "websockets>=8", "pydantic>=2"]
 
-EXTRAS = {}
+EXTRAS = {
+    "msgspec": ["msgspec>=0.18"],
+    "orjson": ["orjson"],
+    "numpy": ["numpy"],
+    "numba": ["numpy", "numba"],
+}
 
 # The rest you shouldn't have to touch too much :)
 # ------------------------------------------------
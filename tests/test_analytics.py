@@ -0,0 +1,160 @@
+from datetime import date
+import json
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+"""
+
+These tests run offline, they check that the numba compiled kernels, their plain Python loops
+and the numpy fallbacks used when numba is not installed all give the same results
+
+"""
+
+
+def transaction(day: str, type_: str, amount: float) -> dict:
+    return {
+        "id": "1",
+        "date": f"{day}T10:00:00",
+        "settlementDate": day,
+        "availabilityDate": day,
+        "tradeDate": day,
+        "account": {"id": "a", "name": "n", "type": "ISK", "urlParameterId": "u"},
+        "orderbook": None,
+        "instrumentName": None,
+        "description": "d",
+        "type": type_,
+        "volume": None,
+        "priceInTradedCurrency": None,
+        "amount": {
+            "value": amount,
+            "unit": "SEK",
+            "unitType": "MONETARY",
+            "decimalPrecision": 2,
+        },
+        "onCreditAccount": False,
+        "comission": None,
+        "currencyRate": None,
+        "noteId": None,
+        "priceInAccountCurrency": None,
+        "intraday": False,
+        "foreignTaxRate": None,
+        "isin": "",
+        "result": None,
+        "volumeFactor": None,
+    }
+
+
+@unittest.skipIf(np is None, "requires numpy")
+class KernelTest(unittest.TestCase):
+    def setUp(self):
+        from avanza.analytics import _kernels
+
+        self.kernels = _kernels
+
+        rng = np.random.default_rng(0)
+        self.amounts = rng.random(1000)
+        self.dates = rng.integers(18000, 18400, 1000)
+        self.types = rng.integers(0, 5, 1000)
+        self.months = rng.integers(1, 13, 1000)
+        self.years = rng.integers(2020, 2023, 1000)
+
+    def test_months_and_years(self):
+        dates = np.array(
+            ["1969-12-31", "1970-01-01", "2020-02-29", "2023-12-01"],
+            dtype="datetime64[D]",
+        )
+
+        months, years = self.kernels.months_and_years(dates)
+
+        self.assertEqual(months.tolist(), [12, 1, 2, 12])
+        self.assertEqual(years.tolist(), [1969, 1970, 2020, 2023])
+
+    def test_sum_by_month_year(self):
+        args = (self.months, self.years, self.amounts, 3, 2021)
+        expected = sum(
+            a
+            for m, y, a in zip(self.months, self.years, self.amounts)
+            if m == 3 and y == 2021
+        )
+
+        self.assertAlmostEqual(self.kernels._sum_by_month_year_loop(*args), expected)
+        self.assertAlmostEqual(self.kernels._sum_by_month_year_numpy(*args), expected)
+        self.assertAlmostEqual(self.kernels.sum_by_month_year(*args), expected)
+
+    def test_sum_by_month_year_no_match(self):
+        args = (self.months, self.years, self.amounts, 1, 1999)
+
+        self.assertEqual(self.kernels._sum_by_month_year_loop(*args), 0.0)
+        self.assertEqual(self.kernels._sum_by_month_year_numpy(*args), 0.0)
+        self.assertEqual(self.kernels.sum_by_month_year(*args), 0.0)
+
+    def test_aggregate(self):
+        args = (self.amounts, self.dates, self.types, 18100, 18200, 6)
+        expected = self.kernels._aggregate_loop(*args)
+
+        # Bounds are inclusive and types without rows sum to zero
+        in_range = (self.dates >= 18100) & (self.dates <= 18200)
+        self.assertAlmostEqual(expected.sum(), self.amounts[in_range].sum())
+        self.assertEqual(expected[5], 0.0)
+
+        np.testing.assert_allclose(self.kernels._aggregate_numpy(*args), expected)
+        np.testing.assert_allclose(self.kernels.aggregate(*args), expected)
+
+    @unittest.skipIf(numba is None, "requires numba")
+    def test_numba_is_used_when_installed(self):
+        self.assertIsNot(
+            self.kernels.sum_by_month_year, self.kernels._sum_by_month_year_numpy
+        )
+        self.assertIsNot(self.kernels.aggregate, self.kernels._aggregate_numpy)
+
+
+@unittest.skipIf(np is None, "requires numpy")
+class TransactionsAnalyticsTest(unittest.TestCase):
+    def setUp(self):
+        from avanza.models import Transactions
+
+        self.transactions = Transactions.model_validate_json(
+            json.dumps(
+                {
+                    "transactions": [
+                        transaction("2020-01-01", "DEPOSIT", 100),
+                        transaction("2020-01-15", "BUY", -40),
+                        transaction("2020-01-31", "DEPOSIT", 50),
+                        transaction("2020-02-01", "DIVIDEND", 5),
+                    ],
+                    "transactionsAfterFiltering": 4,
+                    "transactionsFilter": {
+                        "accountIds": None,
+                        "transactionTypes": None,
+                        "isin": None,
+                        "dateRange": {"from": "2020-01-01", "to": "2020-02-01"},
+                    },
+                    "firstTransactionDate": "2020-01-01",
+                }
+            ),
+            strict=True,
+        )
+
+    def test_sum_amount(self):
+        self.assertAlmostEqual(self.transactions.sum_amount(1, 2020), 110)
+        self.assertAlmostEqual(self.transactions.sum_amount(2, 2020), 5)
+        self.assertAlmostEqual(self.transactions.sum_amount(1, 2021), 0)
+
+    def test_sum_by_type(self):
+        self.assertEqual(
+            self.transactions.sum_by_type(date(2020, 1, 1), date(2020, 1, 31)),
+            {"BUY": -40.0, "DEPOSIT": 150.0, "DIVIDEND": 0.0},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
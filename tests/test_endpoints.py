@@ -1,7 +1,10 @@
+import functools
 from enum import Enum
-from typing import Any, Callable, List, Union
+from typing import Any, Callable, Dict, List, Tuple, Union
 import unittest
 import os
+import tempfile
+from pathlib import Path
 from dotenv import load_dotenv
 from pydantic import ValidationError, TypeAdapter
 
@@ -11,9 +14,43 @@ from avanza.constants import (
     ListType,
     TimePeriod,
 )
-from avanza.models import *
+from avanza.models import (
+    AccountPositions,
+    CertificateDetails,
+    CertificateInfo,
+    ChartData,
+    construct,
+    FundInfo,
+    IndexInfo,
+    InsightsReport,
+    InspirationList,
+    InspirationListItems,
+    Offer,
+    OrderBook,
+    Overview,
+    PriceAlerts,
+    SearchResults,
+    StockInfo,
+    Transactions,
+    WarrantInfo,
+    WatchList,
+)
+
+# Cached responses are written with a trailing newline, like any other text file
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode() + b"\n"
 
-import json
+    json_loads = json.loads
 
 """
 
@@ -26,12 +63,18 @@ It does not however validate that the response model has only these fields, more
 # will fail if no cached response model exists for given test
 USE_CACHE = False
 
+# Builds the models from cached responses with avanza.models.construct instead of validating them,
+# only useful for quickly iterating on code using the models since nothing is validated
+SKIP_VALIDATION_ON_CACHE = False
+
 
 class ReturnModelTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         load_dotenv(override=True)
 
+        load_cached_responses()
+
         if USE_CACHE:
             # Create an instance of Avanza and skip __init__ function that logs in
             # otherwise cls.avanza is undefined and no methods exist on it
@@ -62,17 +105,17 @@ class ReturnModelTest(unittest.TestCase):
         overview = get_or_cache(self.avanza.get_overview)
 
         try:
-            Overview.model_validate(overview, strict=True)
+            _validate_or_construct(Overview, overview)
         except ValidationError as e:
             self.fail(e)
 
     def test_watch_lists(self):
-        watch_lists = get_or_cache(self.avanza.get_watchlists)
+        watch_lists = json_loads(get_or_cache(self.avanza.get_watchlists))
 
         watch_list = watch_lists[0]
 
         try:
-            WatchList.model_validate(watch_list, strict=True)
+            _adapter(WatchList).validate_python(watch_list, strict=True)
         except ValidationError as e:
             self.fail(e)
 
@@ -80,7 +123,7 @@ class ReturnModelTest(unittest.TestCase):
         account_positions = get_or_cache(self.avanza.get_accounts_positions)
 
         try:
-            AccountPositions.model_validate(account_positions, strict=True)
+            _validate_or_construct(AccountPositions, account_positions)
         except ValidationError as e:
             self.fail(e)
 
@@ -90,7 +133,7 @@ class ReturnModelTest(unittest.TestCase):
         )  # OMX Stockholm 30
 
         try:
-            IndexInfo.model_validate(index_info, strict=True)
+            _validate_or_construct(IndexInfo, index_info)
         except ValidationError as e:
             self.fail(e)
 
@@ -98,7 +141,7 @@ class ReturnModelTest(unittest.TestCase):
         fund_info = get_or_cache(self.avanza.get_fund_info, ["878733"])  # Avanza Global
 
         try:
-            FundInfo.model_validate(fund_info, strict=True)
+            _validate_or_construct(FundInfo, fund_info)
         except ValidationError as e:
             self.fail(e)
 
@@ -106,7 +149,7 @@ class ReturnModelTest(unittest.TestCase):
         stock_info = get_or_cache(self.avanza.get_stock_info, ["185896"])  # Netflix
 
         try:
-            StockInfo.model_validate(stock_info, strict=True)
+            _validate_or_construct(StockInfo, stock_info)
         except ValidationError as e:
             self.fail(e)
 
@@ -116,7 +159,7 @@ class ReturnModelTest(unittest.TestCase):
         )
 
         try:
-            CertificateInfo.model_validate(certificate_info, strict=True)
+            _validate_or_construct(CertificateInfo, certificate_info)
         except ValidationError as e:
             self.fail(e)
 
@@ -126,7 +169,7 @@ class ReturnModelTest(unittest.TestCase):
         )
 
         try:
-            CertificateDetails.model_validate(certificate_details, strict=True)
+            _validate_or_construct(CertificateDetails, certificate_details)
         except ValidationError as e:
             self.fail(e)
 
@@ -136,7 +179,7 @@ class ReturnModelTest(unittest.TestCase):
         )
 
         try:
-            WarrantInfo.model_validate(warrant_info, strict=True)
+            _validate_or_construct(WarrantInfo, warrant_info)
         except ValidationError as e:
             self.fail(e)
 
@@ -144,7 +187,7 @@ class ReturnModelTest(unittest.TestCase):
         stock_search_results = get_or_cache(self.avanza.search_for_stock, ["Ap"])
 
         try:
-            SearchResults.validate_python(stock_search_results, strict=True)
+            SearchResults.validate_json(stock_search_results, strict=True)
         except ValidationError as e:
             self.fail(e)
 
@@ -152,7 +195,7 @@ class ReturnModelTest(unittest.TestCase):
         fund_search_results = get_or_cache(self.avanza.search_for_fund, ["Avanza"])
 
         try:
-            SearchResults.validate_python(fund_search_results, strict=True)
+            SearchResults.validate_json(fund_search_results, strict=True)
         except ValidationError as e:
             self.fail(e)
 
@@ -162,7 +205,7 @@ class ReturnModelTest(unittest.TestCase):
         )
 
         try:
-            SearchResults.validate_python(certificate_search_results, strict=True)
+            SearchResults.validate_json(certificate_search_results, strict=True)
         except ValidationError as e:
             self.fail(e)
 
@@ -170,27 +213,29 @@ class ReturnModelTest(unittest.TestCase):
         warrant_search_results = get_or_cache(self.avanza.search_for_warrant, ["NVDA"])
 
         try:
-            SearchResults.validate_python(warrant_search_results, strict=True)
+            SearchResults.validate_json(warrant_search_results, strict=True)
         except ValidationError as e:
             self.fail(e)
 
     def test_get_order_books(self):
-        order_books = get_or_cache(
-            self.avanza.get_order_books,
-            [
-                ["5361"],  # Avanza Bank Holding
-            ],
+        order_books = json_loads(
+            get_or_cache(
+                self.avanza.get_order_books,
+                [
+                    ["5361"],  # Avanza Bank Holding
+                ],
+            )
         )
 
         order_book = order_books[0]
 
         try:
-            OrderBook.model_validate(order_book, strict=True)
+            _adapter(OrderBook).validate_python(order_book, strict=True)
         except ValidationError as e:
             self.fail(e)
 
     def test_get_offers(self):
-        offers = get_or_cache(self.avanza.get_offers)
+        offers = json_loads(get_or_cache(self.avanza.get_offers))
 
         # No current offers, can't validate response model
         if len(offers) == 0:
@@ -199,7 +244,7 @@ class ReturnModelTest(unittest.TestCase):
         offer = offers[0]
 
         try:
-            Offer.model_validate(offer, strict=True)
+            _adapter(Offer).validate_python(offer, strict=True)
         except ValidationError as e:
             self.fail(e)
 
@@ -207,7 +252,7 @@ class ReturnModelTest(unittest.TestCase):
         transactions = get_or_cache(self.avanza.get_transactions_details)
 
         try:
-            Transactions.model_validate(transactions, strict=True)
+            _validate_or_construct(Transactions, transactions)
         except ValidationError as e:
             self.fail(e)
 
@@ -223,7 +268,7 @@ class ReturnModelTest(unittest.TestCase):
                 )
 
                 try:
-                    InsightsReport.model_validate(insights_report, strict=True)
+                    _validate_or_construct(InsightsReport, insights_report)
                 except ValidationError as e:
                     self.fail(e)
 
@@ -233,7 +278,7 @@ class ReturnModelTest(unittest.TestCase):
         )
 
         try:
-            ChartData.model_validate(chart_data, strict=True)
+            _validate_or_construct(ChartData, chart_data)
         except ValidationError as e:
             self.fail(e)
 
@@ -249,8 +294,7 @@ class ReturnModelTest(unittest.TestCase):
         )
 
         try:
-            for alert in price_alerts:
-                PriceAlert.model_validate(alert, strict=True)
+            PriceAlerts.validate_json(price_alerts, strict=True)
         except ValidationError as e:
             self.fail(e)
 
@@ -258,8 +302,7 @@ class ReturnModelTest(unittest.TestCase):
         inspiration_lists = get_or_cache(self.avanza.get_inspiration_lists)
 
         try:
-            for list in inspiration_lists:
-                InspirationListItem.model_validate(list, strict=True)
+            InspirationListItems.validate_json(inspiration_lists, strict=True)
         except ValidationError as e:
             self.fail(e)
 
@@ -269,7 +312,7 @@ class ReturnModelTest(unittest.TestCase):
         )
 
         try:
-            InspirationList.model_validate(inspiration_list, strict=True)
+            _validate_or_construct(InspirationList, inspiration_list)
         except ValidationError as e:
             self.fail(e)
 
@@ -279,7 +322,7 @@ class ReturnModelTest(unittest.TestCase):
         )  # Most owned stocks
 
         try:
-            InspirationList.model_validate(inspiration_list, strict=True)
+            _validate_or_construct(InspirationList, inspiration_list)
         except ValidationError as e:
             self.fail(e)
 
@@ -287,10 +330,57 @@ class ReturnModelTest(unittest.TestCase):
 # HELPERS
 
 
-def get_or_cache(fn: Callable[..., Any], args: List[Union[str, Enum, List[str]]] = []):
+@functools.cache
+def _adapter(model: type) -> TypeAdapter:
+    """TypeAdapter for model, built once and reused by every test validating it"""
+    return TypeAdapter(model)
+
+
+# Every model validated by the tests, their adapters are built when the module is imported
+# so no test pays for building a validator
+_ALL_MODELS = (
+    AccountPositions,
+    CertificateDetails,
+    CertificateInfo,
+    ChartData,
+    FundInfo,
+    IndexInfo,
+    InsightsReport,
+    InspirationList,
+    Offer,
+    OrderBook,
+    Overview,
+    StockInfo,
+    Transactions,
+    WarrantInfo,
+    WatchList,
+)
+
+for _model in _ALL_MODELS:
+    _adapter(_model)
+
+
+def _validate_or_construct(model: type, raw: bytes):
+    """
+    Validates raw against model, unless both USE_CACHE and SKIP_VALIDATION_ON_CACHE are set
+
+    Then the response was already validated when it was cached, and the model is built
+    without any validation, so a response not matching the model will not fail the test
+    """
+    if USE_CACHE and SKIP_VALIDATION_ON_CACHE:
+        return construct(model, json_loads(raw))
+
+    return _adapter(model).validate_json(raw, strict=True)
+
+
+def get_or_cache(
+    fn: Callable[..., Any], args: List[Union[str, Enum, List[str]]] = []
+) -> bytes:
     """
     Tries to read response model from file, if not exists calls API and writes the response to a file called the name of the function
 
+    Returns the raw JSON body, so it can be validated with validate_json without building an intermediate dict
+
     This helps when debugging response models, since you can run the tests without
     getting an error from Avanza for trying to log in too often
 
@@ -298,39 +388,75 @@ def get_or_cache(fn: Callable[..., Any], args: List[Union[str, Enum, List[str]]]
 
     """
 
-    formatted_args = (
-        "" if not args else f".{'.'.join([sanitize_arg(arg) for arg in args])}"
-    )
+    file_name = cache_file_name(fn.__name__, tuple(sanitize_arg(arg) for arg in args))
 
-    file_name = f"{fn.__name__}{formatted_args}.json"
+    cached = _cached_responses.get(file_name)
+    if cached is not None:
+        return cached
 
-    output = None
-    try:
-        with open(file_name, "r") as f:
-            output = json.load(f)
-    except:
-        if USE_CACHE:
-            raise AssertionError(
-                f"Failed to find cached response for {file_name}, but USE_CACHE was True! Set USE_CACHE to False in order to call Avanza and cache response"
-            )
+    path = Path(file_name)
+    if path.exists():
+        return path.read_bytes()
+
+    if USE_CACHE:
+        raise AssertionError(
+            f"Failed to find cached response for {file_name}, but USE_CACHE was True! Set USE_CACHE to False in order to call Avanza and cache response"
+        )
 
-        output = fn(*args)
+    output = json_dumps(fn(*args))
 
-        with open(file_name, "w") as f:
-            json.dump(output, f)
+    # Write to a temporary file and move it in place, so tests running in parallel
+    # never read a partially written response
+    f = tempfile.NamedTemporaryFile(dir=path.parent, delete=False)
+    try:
+        with f:
+            f.write(output)
+        # NamedTemporaryFile is only readable by the owner, use the mode open() would give
+        os.chmod(f.name, 0o666 & ~_UMASK)
+        os.replace(f.name, path)
+    except BaseException:
+        os.unlink(f.name)
+        raise
+
+    _cached_responses[file_name] = output
 
     return output
 
 
-def sanitize_arg(arg: Union[str, Enum, List[str]]) -> str:
-    if isinstance(arg, Enum):
-        return arg.value
+# os.umask can only be read by setting it, so set and restore it once on import
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Cached responses by file name, read once by setUpClass instead of opening a file in every test
+_cached_responses: Dict[str, bytes] = {}
+
 
-    if isinstance(arg, List):
-        return ".".join(arg)
+def load_cached_responses() -> None:
+    for path in Path().glob("*.json"):
+        _cached_responses[path.name] = path.read_bytes()
 
+
+@functools.lru_cache(maxsize=None)
+def cache_file_name(fn_name: str, args: Tuple[str, ...]) -> str:
+    formatted_args = "" if not args else f".{'.'.join(args)}"
+
+    return f"{fn_name}{formatted_args}.json"
+
+
+@functools.singledispatch
+def sanitize_arg(arg: Union[str, Enum, List[str]]) -> str:
     return arg
 
 
+@sanitize_arg.register
+def _(arg: Enum) -> str:
+    return arg.value
+
+
+@sanitize_arg.register
+def _(arg: list) -> str:
+    return ".".join(arg)
+
+
 if __name__ == "__main__":
     unittest.main()